@@ -236,7 +236,15 @@ class MemoryBuffer:
     def write_number(self, value: int, size: int, *, signed: bool=False) -> None:
         """Write number with specified size (in bytes).
         """
-        self.write(value.to_bytes(size, self.byteorder.value, signed=signed))
+        # Inlined `write`, as this is the hot path for all numeric writes. Value is converted
+        # first, so the buffer is not resized when it does not fit into `size` bytes.
+        data = value.to_bytes(size, self.byteorder.value, signed=signed)
+        pos = self.pos
+        end = pos + size
+        if len(self.raw) < end:
+            self.resize(end)
+        self.raw[pos:end] = data
+        self.pos = end
     def write_short(self, value: int) -> None:
         """Write 2 byte number (c_ushort).
         """
@@ -284,10 +292,14 @@ class MemoryBuffer:
         Raises:
             BufferError: When `size` is specified, but there is not enough bytes to read.
         """
-        self._check_space(size)
-        result = (0).from_bytes(self.raw[self.pos: self.pos + size], self.byteorder.value, signed=signed)
-        self.pos += size
-        return result
+        # Inlined `_check_space`, as this is the hot path for all numeric reads
+        pos = self.pos
+        end = pos + size
+        raw = self.raw
+        if len(raw) < end:
+            raise BufferError("Insufficient buffer size")
+        self.pos = end
+        return int.from_bytes(raw[pos:end], self.byteorder.value, signed=signed)
     def read_byte(self, *, signed: bool=False) -> int:
         """Read 1 byte number (c_ubyte).
         """
@@ -66,6 +66,7 @@ from configparser import (
 )
 from decimal import Decimal, DecimalException
 from enum import Enum, Flag
+from functools import lru_cache
 from inspect import Parameter, Signature, signature
 from pathlib import Path
 from typing import Any, Generic, TypeVar, cast, get_type_hints
@@ -101,6 +102,21 @@ def unindent_verticals(value: str) -> str:
 def _eq(a: Any, b: Any) -> bool:
     return str(a) == str(b)
 
+@lru_cache(maxsize=256)
+def _get_description_lines(description: str, value_description: str, *, required: bool) -> tuple[str, ...]:
+    """Returns option description formatted as comment lines for configuration file.
+    """
+    lines = []
+    if required:
+        lines.append("; REQUIRED option.\n")
+    for line in description.strip().splitlines():
+        lines.append(f"; {line}\n")
+    first = True
+    for line in value_description.splitlines():
+        lines.append(f"; {'Type: ' if first else ''}{line}\n")
+        first = False
+    return tuple(lines)
+
 # Next two functions are copied from stdlib enum module, as they were removed in Python 3.11
 def _decompose(flag, value):
     """
@@ -112,19 +128,21 @@ def _decompose(flag, value):
     # issue29167: wrap accesses to _value2member_map_ in a list to avoid race
     #             conditions between iterating over it and having more pseudo-
     #             members added to it
+    # composite pseudo-members created on demand have names as well, so named flags are
+    # only those defined in flag class
     if negative:
         # only check for named flags
         flags_to_check = [
                 (m, v)
                 for v, m in list(flag._value2member_map_.items())
-                if m.name is not None
+                if m.name in flag._member_map_
                 ]
     else:
         # check for named flags and powers-of-two flags
         flags_to_check = [
                 (m, v)
                 for v, m in list(flag._value2member_map_.items())
-                if m.name is not None or _power_of_two(v)
+                if m.name in flag._member_map_ or _power_of_two(v)
                 ]
     members = []
     for member, member_value in flags_to_check:
@@ -555,16 +573,11 @@ class Option(Generic[T], ABC):
            This function is intended for internal use. To get string describing current
            configuration that is suitable for configuration files, use `get_config` method.
         """
-        lines = []
-        if not plain:
-            if self.required:
-                lines.append("; REQUIRED option.\n")
-            for line in self.description.strip().splitlines():
-                lines.append(f"; {line}\n")
-            first = True
-            for line in self._get_value_description().splitlines():
-                lines.append(f"; {'Type: ' if first else ''}{line}\n")
-                first = False
+        if plain:
+            lines = []
+        else:
+            lines = list(_get_description_lines(self.description, self._get_value_description(),
+                                                required=self.required))
         value = self.get_value()
         nodef = ';' if value == self.default else ''
         value = '<UNDEFINED>' if value is None else self.get_formatted()
@@ -1405,12 +1418,10 @@ class EnumOption(Option[Enum]):
         Raises:
             ValueError: When the argument is not a valid option value.
         """
-        name = value.lower()
-        if name in self._members:
-            self.set_value(self._members[name])
-        else:
+        if (member := self._members.get(value.lower())) is None:
             raise ValueError(f"Illegal value '{value}' for enum type "
                              f"'{self.datatype.__name__}'")
+        self.set_value(member)
     def get_as_str(self) -> str:
         """Returns value as string.
         """
@@ -1500,12 +1511,13 @@ class FlagOption(Option[Flag]):
         Raises:
             ValueError: When the argument is not a valid option value.
         """
+        members = self._members
         result = self.datatype(0)
-        for name in (x.strip().lower() for x in value.split('|' if '|' in value else ',')):
-            if name in self._members:
-                result |= self._members[name]
-            else:
+        for item in value.split('|' if '|' in value else ','):
+            name = item.strip().lower()
+            if (member := members.get(name)) is None:
                 raise ValueError(f"Illegal value '{name}' for flag option '{self.name}'")
+            result |= member
         self.set_value(result)
     def get_as_str(self) -> str:
         """Returns value as string.
@@ -1533,7 +1545,7 @@ class FlagOption(Option[Flag]):
         self._check_value(value)
         if value is not None:
             members, uncovered = _decompose(self.datatype, value.value)
-            if uncovered or [i for i in members if i.name is None or i.name.lower() not in self._members]:
+            if uncovered or any(i not in self.allowed for i in members):
                 raise ValueError(f"Illegal value '{value!s}' for flag option '{self.name}'")
         self._value = value
     def load_proto(self, proto: ConfigProto) -> None:
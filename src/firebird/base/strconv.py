@@ -44,6 +44,7 @@ from decimal import Decimal, DecimalException
 from enum import Enum, IntEnum, IntFlag
 from typing import Any
 from uuid import UUID
+from weakref import WeakKeyDictionary
 
 from .collections import Registry
 from .types import MIME, Distinct, ZMQAddress
@@ -77,6 +78,8 @@ class Convertor(Distinct):
 
 _convertors: Registry = Registry()
 _classes = {}
+#: Enum/Flag members by lowercase name, built on first conversion
+_enum_members: WeakKeyDictionary[type, dict[str, Enum]] = WeakKeyDictionary()
 
 # Convertors
 
@@ -119,6 +122,11 @@ def register_class(cls: type) -> None:
         raise TypeError(f"Class '{cls.__name__}' already registered as '{_classes[cls.__name__]!r}'")
     _classes[cls.__name__] = cls
 
+def _get_enum_members(cls: type) -> dict[str, Enum]:
+    if (members := _enum_members.get(cls)) is None:
+        members = _enum_members[cls] = {k.lower(): v for k, v in cls.__members__.items()}
+    return members
+
 def _get_convertor(cls: type | str) -> Convertor:
     if isinstance(cls, str):
         cls = _classes.get(cls, cls)
@@ -249,12 +257,13 @@ def _register():
         return value.name
     def str2enum(cls: type, value: str) -> Enum:
         "Converts string to Enum/Flag value"
-        return {k.lower(): v for k, v in cls.__members__.items()}[value.lower()]
+        return _get_enum_members(cls)[value.lower()]
     def str2flag(cls: type, value: str) -> Enum:
         "Converts string to Enum/Flag value"
+        members = _get_enum_members(cls)
         result = None
         for item in value.lower().split('|'):
-            value = {k.lower(): v for k, v in cls.__members__.items()}[item]
+            value = members[item]
             if result:
                 result |= value
             else:
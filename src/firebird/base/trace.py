@@ -38,16 +38,20 @@
 
 from __future__ import annotations
 
+import ast
 import os
+from collections import defaultdict
 from collections.abc import Callable, Hashable
 from configparser import ConfigParser
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import IntFlag, auto
 from functools import partial, wraps
-from inspect import Signature, isfunction, signature
+from inspect import Parameter, Signature, getattr_static, isfunction, signature
 from time import monotonic
+from types import MethodType
 from typing import Any
+from weakref import WeakKeyDictionary
 
 from firebird.base.collections import Registry
 from firebird.base.config import (
@@ -64,6 +68,57 @@ from firebird.base.logging import ContextLoggerAdapter, FStrMessage, LogLevel, g
 from firebird.base.strconv import convert_from_str
 from firebird.base.types import DEFAULT, UNLIMITED, Distinct, Error, load
 
+#: True if trace is enabled. Determined on import from `FBASE_TRACE` environment variable,
+#: or from `__debug__` if this variable is not defined.
+_trace_enabled: bool = convert_from_str(bool, os.getenv('FBASE_TRACE', str(__debug__)))
+
+#: Cache of signatures of traced functions
+_signatures: WeakKeyDictionary[Callable, Signature] = WeakKeyDictionary()
+
+def _get_signature(fn: Callable) -> Signature:
+    """Returns signature of `fn`. Signatures of plain functions are cached.
+    """
+    if not isfunction(fn):
+        return signature(fn)
+    if (sig := _signatures.get(fn)) is None:
+        sig = _signatures[fn] = signature(fn)
+    return sig
+
+def _has_instance_param(fn: Callable) -> bool:
+    """Returns True if first parameter of `fn` is a positional one that receives the instance
+    when `fn` is called as bound method.
+    """
+    param = next(iter(_get_signature(fn).parameters.values()), None)
+    return param is not None and param.kind in (Parameter.POSITIONAL_ONLY,
+                                                 Parameter.POSITIONAL_OR_KEYWORD)
+
+def _get_etime(start: float) -> str:
+    """Returns string with elapsed time since `start`.
+    """
+    e = str(Decimal(monotonic() - start))
+    return e[:e.find('.')+6]
+
+def _trim(value: Any, max_len: int) -> Any:
+    """Returns `value`, or its string representation trimmed to `max_len` characters when
+    it's longer.
+    """
+    if (i := len(s := str(value))) > max_len:
+        return f'{s[:max_len]}..[{i - max_len}]'
+    return value
+
+#: Cache of instrumented class functions: class -> {trace specification: instrumented function}
+_wrapped_cache: WeakKeyDictionary[type, dict[tuple, Callable]] = WeakKeyDictionary()
+
+def _get_names(template: str) -> frozenset[str] | None:
+    """Returns names referenced by f-string `template`, or `None` when template could not
+    be parsed (in which case all names must be considered as referenced).
+    """
+    try:
+        tree = ast.parse(f'f"""{template}"""', mode='eval')
+    except SyntaxError:
+        return None
+    return frozenset(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+
 
 class TraceFlag(IntFlag):
     """`LoggingManager` trace/audit flags.
@@ -74,7 +129,34 @@ class TraceFlag(IntFlag):
     AFTER = auto()
     FAIL = auto()
 
-@dataclass
+# Integer masks for fast trace flag checks
+_M_ACTIVE: int = int(TraceFlag.ACTIVE)
+_M_BEFORE: int = _M_ACTIVE | int(TraceFlag.BEFORE)
+_M_AFTER: int = _M_ACTIVE | int(TraceFlag.AFTER)
+_M_FAIL: int = _M_ACTIVE | int(TraceFlag.FAIL)
+_M_ALL: int = _M_BEFORE | _M_AFTER | _M_FAIL
+
+# Trace actions
+_DO_BEFORE: int = 1
+_DO_AFTER: int = 2
+_DO_FAIL: int = 4
+
+def _get_actions(flags: int) -> int:
+    """Returns trace actions (bit mask of `_DO_*` values) for trace `flags`.
+    """
+    result = 0
+    if (flags & _M_BEFORE) == _M_BEFORE:
+        result |= _DO_BEFORE
+    if (flags & _M_AFTER) == _M_AFTER:
+        result |= _DO_AFTER
+    if (flags & _M_FAIL) == _M_FAIL:
+        result |= _DO_FAIL
+    return result
+
+#: Trace actions for all combinations of trace flags
+_ACTIONS: tuple[int, ...] = tuple(_get_actions(flags) for flags in range(_M_ALL + 1))
+
+@dataclass(slots=True)
 class TracedItem(Distinct):
     """Class method trace specification.
     """
@@ -82,19 +164,71 @@ class TracedItem(Distinct):
     decorator: Callable
     args: list = field(default_factory=list)
     kwargs: dict = field(default_factory=dict)
+    _wrapped: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _prepared: Callable | None = field(default=None, init=False, repr=False, compare=False)
     def get_key(self) -> Hashable:
         """Returns Distinct key for traced item [method]."""
         return self.method
+    def prepare(self, cls: type) -> Callable[[Any], Callable]:
+        """Returns callable that returns instrumented method for instance of `cls`.
+
+        Class functions instrumented by `traced` (or its descendant) are instrumented only
+        once, and the instrumented function is then bound to each instance. Other decorators,
+        callables (like static or class methods) and functions that do not declare positional
+        parameter for the instance (like `def fn(*args)`) are instrumented on each call, and
+        decorators get the bound method.
+        """
+        def instrument(fn: Callable) -> Callable:
+            decorator = self.decorator(*self.args, **self.kwargs)
+            if isinstance(decorator, traced):
+                # Instrumented function will be bound to instances
+                decorator._method = True
+            return decorator(fn)
+
+        if self._prepared is None:
+            if (isinstance(self.decorator, type) and issubclass(self.decorator, traced)
+                and isfunction(fn := getattr_static(cls, self.method)) and _has_instance_param(fn)):
+                # Instrumented function is reused for the same trace specification, for example
+                # when trace configuration is reloaded.
+                key = (fn, self.decorator, tuple(self.args), tuple(sorted(self.kwargs.items())))
+                try:
+                    hash(key)
+                except TypeError:
+                    # Specification with unhashable arguments (like `extra` dict)
+                    self._wrapped = instrument(fn)
+                else:
+                    cache = _wrapped_cache.setdefault(cls, {})
+                    if (wrapped := cache.get(key)) is None:
+                        wrapped = cache[key] = instrument(fn)
+                    self._wrapped = wrapped
+                factory = partial(MethodType, self._wrapped)
+            else:
+                def factory(obj: Any) -> Callable:
+                    return self.decorator(*self.args, **self.kwargs)(getattr(obj, self.method))
+            self._prepared = factory
+        return self._prepared
 
-@dataclass
+@dataclass(slots=True)
 class TracedClass(Distinct):
     """Traced class registry entry.
     """
     cls: type
     traced: Registry = field(default_factory=Registry)
+    _compiled: tuple[tuple[str, Callable[[Any], Callable]], ...] | None = \
+        field(default=None, init=False, repr=False, compare=False)
     def get_key(self) -> Hashable:
         """Returns Distinct key for traced item [cls]."""
         return self.cls
+    def get_compiled(self) -> tuple[tuple[str, Callable[[Any], Callable]], ...]:
+        """Returns tuple of (method name, instrumented method factory) pairs for all
+        traced items.
+        """
+        if self._compiled is None:
+            self._compiled = tuple((item.method, item.prepare(self.cls)) for item in self.traced)
+        return self._compiled
+    def invalidate(self) -> None:
+        """Must be called whenever traced items are changed."""
+        self._compiled = None
 
 
 class TracedMeta(type):
@@ -111,16 +245,33 @@ class TracedMixin(metaclass=TracedMeta):
         super().__init_subclass__(**kwargs)
         trace_manager.register(cls)
 
+class _Untraced:
+    """Identity decorator used instead of `traced` instances when trace is disabled.
+    """
+    __slots__ = ()
+    def __call__(self, fn: Callable) -> Callable:
+        return fn
+
+_UNTRACED: _Untraced = _Untraced()
+
 class traced: # noqa: N801
     """Base decorator for logging of callables, suitable for trace/audit.
 
     It's not applied on decorated function/method if `FBASE_TRACE` environment variable is
     set to False, or if `FBASE_TRACE` is not defined and `__debug__` is False (optimized
-    Python code).
+    Python code). The environment variable is evaluated only once, when this module is
+    imported.
 
     Both positional and keyword arguments of decorated callable are available by name for
     f-string type message interpolation.
     """
+    __slots__ = ('_method', 'agent', 'callback', 'extra', 'flags', 'has_result', 'level',
+                 'max_len', 'msg_after', 'msg_before', 'msg_failed', 'topic', 'with_args')
+    def __new__(cls, *args, **kwargs): # noqa: ARG004
+        # When trace is disabled, all decorators are replaced by single identity decorator
+        if not _trace_enabled:
+            return _UNTRACED
+        return super().__new__(cls)
     def __init__(self, *, agent: Any=DEFAULT, topic: str='trace',
                  msg_before: str=DEFAULT, msg_after: str=DEFAULT, msg_failed: str=DEFAULT,
                  flags: TraceFlag=TraceFlag.NONE, level: LogLevel=LogLevel.DEBUG,
@@ -173,6 +324,9 @@ class traced: # noqa: N801
         self.has_result: bool = has_result
         #: If True, function arguments are available for interpolation in `msg_before`
         self.with_args: bool = with_args
+        # True when decorated callable is a class function whose first argument is
+        # the instance (set by `TracedItem.prepare`).
+        self._method: bool = False
     def __callback(self, agent: Any) -> bool: # noqa: ARG002
         """Default callback, does nothing.
         """
@@ -208,61 +362,69 @@ class traced: # noqa: N801
     def __call__(self, fn: Callable):
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            flags = trace_manager.flags | self.flags
-            if enabled := ((TraceFlag.ACTIVE in flags) and int(flags) > 1):
-                params = {}
-                bound = sig.bind_partial(*args, **kwargs)
-                # If it's not a bound method, look for 'self'
-                log = get_logger(bound.arguments.get('self', 'function') if self.agent is None
-                                 else self.agent, self.topic)
-                if enabled := (log.isEnabledFor(self.level) and self.callback(self.agent)):
-                    if self.with_args:
-                        bound.apply_defaults()
-                        params.update(bound.arguments)
-                        if self.max_len is not UNLIMITED:
-                            for k, v in params.items():
-                                s = str(v)
-                                if (i := len(s)) > self.max_len:
-                                    params[k] = f'{s[:self.max_len]}..[{i - self.max_len}]'
-                    if self.extra is not None:
-                        params.update(self.extra)
-                    params['_fname_'] = fn.__name__
-                    params['_result_'] = None
+            actions = _ACTIONS[(int(trace_manager._flags) | int(self.flags)) & _M_ALL]
+            if enabled := actions:
+                if instance_agent:
+                    agent = log_agent = args[0]
+                elif (agent := self.agent) is None:
+                    # If it's not a bound method, use 'self'
+                    log_agent = args[0] if has_self and args else 'function'
+                else:
+                    log_agent = agent
+                log = get_logger(log_agent, self.topic)
+                if enabled := (log.isEnabledFor(self.level) and self.callback(agent)):
+                    if need_params:
+                        params = {}
+                        if need_args:
+                            bound = sig.bind_partial(*args[1:], **kwargs) if method \
+                                else sig.bind_partial(*args, **kwargs)
+                            bound.apply_defaults()
+                            if max_len is None:
+                                params.update(bound.arguments)
+                            else:
+                                params.update({k: _trim(v, max_len) for k, v in bound.arguments.items()})
+                        if need_extra:
+                            params.update(self.extra)
+                        params['_fname_'] = fn.__name__
+                        params['_result_'] = None
+                    else:
+                        params = {}
                     #
-                    if TraceFlag.BEFORE in flags:
+                    if actions & _DO_BEFORE:
                         self.log_before(log, params)
             result = None
             start = monotonic()
             try:
                 result = fn(*args, **kwargs)
             except Exception as exc:
-                if enabled and TraceFlag.FAIL | TraceFlag.ACTIVE in flags:
-                    e = str(Decimal(monotonic() - start))
-                    params['_etime_'] = e[:e.find('.')+6]
-                    params['_exc_'] = f'{exc.__class__.__qualname__}: {exc}'
+                if enabled and actions & _DO_FAIL:
+                    if need_etime:
+                        params['_etime_'] = _get_etime(start)
+                    if need_exc:
+                        params['_exc_'] = f'{exc.__class__.__qualname__}: {exc}'
                     self.log_failed(log, params)
                 raise
             else:
-                if enabled and TraceFlag.AFTER | TraceFlag.ACTIVE in flags:
-                    e = str(Decimal(monotonic() - start))
-                    params['_etime_'] = e[:e.find('.')+6]
-                    if self.has_result:
-                        params['_result_'] = result
-                        if self.max_len is not UNLIMITED:
-                            s = str(result)
-                            if (i := len(s)) > self.max_len:
-                                params['_result_'] = f'{s[:self.max_len]}..[{i - self.max_len}]'
+                if enabled and actions & _DO_AFTER:
+                    if need_etime:
+                        params['_etime_'] = _get_etime(start)
+                    if need_result:
+                        params['_result_'] = result if max_len is None else _trim(result, max_len)
                     self.log_after(log, params)
             return result
 
-        if (trace := os.getenv('FBASE_TRACE')) is not None:
-            if not convert_from_str(bool, trace):
-                return fn
-        elif not __debug__:
+        if not _trace_enabled:
             return fn
+        sig = _get_signature(fn)
+        if method := self._method:
+            # The first argument is the instance, which is not a parameter for messages
+            sig = sig.replace(parameters=tuple(sig.parameters.values())[1:])
+        # Instance is the agent of instrumented class functions
+        instance_agent = method and self.agent is DEFAULT
         if self.agent is DEFAULT:
-            self.agent = getattr(fn, '__self__', None)
-        sig = signature(fn)
+            self.agent = None if method else getattr(fn, '__self__', None)
+        # If it's not a bound method, 'self' is used as agent for logging
+        has_self = not method and next(iter(sig.parameters), None) == 'self'
         if self.has_result is DEFAULT:
             self.has_result = sig.return_annotation != 'None'
         if self.msg_before is DEFAULT:
@@ -271,6 +433,29 @@ class traced: # noqa: N801
             self.set_after_msg(fn, sig)
         if self.msg_failed is DEFAULT:
             self.set_fail_msg(fn, sig)
+        # Determine which interpolation parameters are actually referenced by messages,
+        # so the wrapper could skip the work for those that are not. Overridden log_* methods
+        # may use any parameter.
+        cls = type(self)
+        if (cls.log_before is traced.log_before and cls.log_after is traced.log_after
+            and cls.log_failed is traced.log_failed):
+            names = set()
+            for msg in (self.msg_before, self.msg_after, self.msg_failed):
+                if (msg_names := _get_names(msg)) is None:
+                    names = None
+                    break
+                names.update(msg_names)
+        else:
+            names = None
+        def needs(*items) -> bool:
+            return names is None or not names.isdisjoint(items)
+        need_args = self.with_args and needs(*sig.parameters)
+        need_extra = self.extra is not None and needs(*self.extra)
+        need_result = self.has_result and needs('_result_')
+        need_etime = needs('_etime_')
+        need_exc = needs('_exc_')
+        need_params = names is None or bool(names)
+        max_len = None if self.max_len is UNLIMITED else self.max_len
         return wrapper
 
 class BaseTraceConfig(Config):
@@ -332,9 +517,8 @@ class TracedClassConfig(BaseTraceConfig):
             ListOption('methods', str, "Names of traced class methods")
         #: Configuration sections with extended config of traced class methods
         self.special: ConfigListOption = \
-            ConfigListOption('special',
-                             "Configuration sections with extended config of traced class methods",
-                             TracedMethodConfig)
+            ConfigListOption('special', TracedMethodConfig,
+                             "Configuration sections with extended config of traced class methods")
         #: Wherher configuration should be applied also to all registered descendant classes [default: True].
         self.apply_to_descendants: BoolOption = \
             BoolOption('apply_to_descendants',
@@ -353,9 +537,8 @@ class TraceConfig(BaseTraceConfig):
                        default=True)
         #: Configuration sections with traced Python classes [required].
         self.classes: ConfigListOption = \
-            ConfigListOption('classes',
-                             "Configuration sections with traced Python classes",
-                             TracedClassConfig, required=True)
+            ConfigListOption('classes', TracedClassConfig,
+                             "Configuration sections with traced Python classes", required=True)
 
 class TraceManager:
     """Trace manager.
@@ -365,8 +548,9 @@ class TraceManager:
         #: default: `traced`.
         self.decorator: Callable = traced
         self._traced: Registry = Registry()
+        self._by_name: dict[str, type] = {}
         self._flags: TraceFlag = TraceFlag.NONE
-        self.trace_active = convert_from_str(bool, os.getenv('FBASE_TRACE', str(__debug__)))
+        self.trace_active = _trace_enabled
         if convert_from_str(bool, os.getenv('FBASE_TRACE_BEFORE', 'no')): # pragma: no cover
             self.set_flag(TraceFlag.BEFORE)
         if convert_from_str(bool, os.getenv('FBASE_TRACE_AFTER', 'no')): # pragma: no cover
@@ -382,6 +566,7 @@ class TraceManager:
         """
         for cls in self._traced:
             cls.traced.clear()
+            cls.invalidate()
     def register(self, cls: type) -> None:
         """Register class for trace.
 
@@ -392,6 +577,7 @@ class TraceManager:
         """
         if cls not in self._traced:
             self._traced.store(TracedClass(cls))
+            self._by_name[f'{cls.__module__}.{cls.__name__}'] = cls
     def add_trace(self, cls: type, method: str, / , *args, **kwargs) -> None:
         """Add/update trace specification for class method.
 
@@ -401,7 +587,9 @@ class TraceManager:
             args: Positional arguments for decorator
             kwargs: Keyword arguments for decorator
         """
-        self._traced[cls].traced.update(TracedItem(method, self.decorator, args, kwargs))
+        entry: TracedClass = self._traced[cls]
+        entry.traced.update(TracedItem(method, self.decorator, args, kwargs))
+        entry.invalidate()
     def remove_trace(self, cls: type, method: str) -> None:
         """Remove trace specification for class method.
 
@@ -409,7 +597,9 @@ class TraceManager:
             cls: Registered traced class
             method: Name of class method
         """
-        del self._traced[cls].traced[method]
+        entry: TracedClass = self._traced[cls]
+        del entry.traced[method]
+        entry.invalidate()
     def trace_object(self, obj: Any, *, strict: bool=False) -> Any:
         """Instruments object's methods with decorators according to trace configuration.
 
@@ -425,18 +615,15 @@ class TraceManager:
         Raises:
             TypeError: When object class is not registered and `strict` is True.
         """
-        if (trace := os.getenv('FBASE_TRACE')) is not None:
-            if not convert_from_str(bool, trace):
-                return obj
-        elif not __debug__:
+        if not _trace_enabled:
             return obj
         entry: TracedClass = self._traced.get(obj.__class__)
         if entry is None:
             if strict:
                 raise TypeError(f"Class '{obj.__class__.__name__}' not registered for trace!")
             return obj
-        for item in entry.traced:
-            setattr(obj, item.method, item.decorator(*item.args, **item.kwargs)(getattr(obj, item.method)))
+        for method, factory in entry.get_compiled():
+            setattr(obj, method, factory(obj))
         return obj
     def load_config(self, config: ConfigParser, section: str='trace') -> None:
         """Update trace from configuration.
@@ -464,7 +651,14 @@ class TraceManager:
         def apply_on(cls):
             if (items := cls_cfg.methods.value) is not None:
                 if (len(items) == 1) and (items[0] == '*'):
-                    items = [i for i in dir(cls) if not i.startswith('_') and isfunction(getattr(cls, i))]
+                    # Walk class dictionaries directly, to avoid sorting and descriptor invocation
+                    # done by dir() and getattr(). First definition in MRO wins.
+                    members = {}
+                    for base in cls.__mro__[:-1]:
+                        for name, value in vars(base).items():
+                            members.setdefault(name, value)
+                    items = [name for name, value in members.items() if not name.startswith('_')
+                             and (isfunction(value) or isinstance(value, staticmethod))]
                 for item in items:
                     self.add_trace(cls, item, *[], **cls_kwargs)
             if (items := cls_cfg.special.value) is not None:
@@ -474,9 +668,13 @@ class TraceManager:
                     kwargs.update(cls_kwargs)
                     kwargs.update(build_kwargs(mcfg))
                     self.add_trace(cls, method, *[], **kwargs)
-        def with_name(name: str, obj: Any) -> bool:
-            return f'{obj.cls.__module__}.{obj.cls.__name__}' == name
+        def add_descendant(cls: type) -> None:
+            for base in cls.__mro__[1:]:
+                descendants[base].append(cls)
 
+        descendants: dict[type, list[type]] = defaultdict(list)
+        for cls_desc in self._traced:
+            add_descendant(cls_desc.cls)
         cfg = TraceConfig('trace')
         cfg.load_config(config, section)
         self.flags = cfg.flags.value
@@ -486,19 +684,19 @@ class TraceManager:
             cls_kwargs = {}
             cls_kwargs.update(global_kwargs)
             cls_kwargs.update(build_kwargs(cls_cfg))
-            if (cls_desc := self._traced.find(partial(with_name, cls_name))) is None:
+            if (cls_desc := self._traced.get(self._by_name.get(cls_name))) is None:
                 if cfg.autoregister.value:
                     cls = load(':'.join(cls_name.rsplit('.', 1)))
                     self.register(cls)
+                    add_descendant(cls)
                 else:
                     raise Error(f"Class '{cls_name}' is not registered for trace.")
             else:
                 cls = cls_desc.cls
             apply_on(cls)
             if cls_cfg.apply_to_descendants.value:
-                for cls_desc in self._traced.values():
-                    if (cls_desc.cls is not cls) and issubclass(cls_desc.cls, cls):
-                        apply_on(cls_desc.cls)
+                for descendant in descendants.get(cls, ()):
+                    apply_on(descendant)
     def set_flag(self, flag: TraceFlag) -> None:
         """Set flag specified by `flag` mask.
         """
@@ -536,3 +734,24 @@ add_trace = trace_manager.add_trace
 remove_trace = trace_manager.remove_trace
 #: shortcut for `trace_manager.trace_object()`
 trace_object = trace_manager.trace_object
+
+def set_trace_enabled(value: bool) -> None: # noqa: FBT001
+    """Enables or disables trace at runtime, overriding the decision made from `FBASE_TRACE`
+    environment variable (or `__debug__`) on import. Also sets `.TraceManager.trace_active`
+    of `trace_manager` to the same value.
+
+    Arguments:
+        value: True to enable trace, False to disable it.
+
+    Important:
+        Affects only callables decorated by `traced` and instances instrumented by
+        `trace_object` after the call.
+    """
+    global _trace_enabled # noqa: PLW0603
+    _trace_enabled = value
+    trace_manager.trace_active = value
+    _wrapped_cache.clear()
+    for entry in trace_manager._traced:
+        for item in entry.traced:
+            item._prepared = None
+        entry.invalidate()
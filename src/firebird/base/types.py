@@ -38,11 +38,14 @@
 
 from __future__ import annotations
 
+import re
 import sys
 from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import Callable, Hashable
 from enum import Enum, IntEnum
+from functools import lru_cache
 from importlib import import_module
+from operator import attrgetter
 from typing import Any, AnyStr, ClassVar, cast
 from weakref import WeakValueDictionary
 
@@ -55,7 +58,8 @@ class Error(Exception):
 
     Important:
         Attribute lookup on this class never fails, as all attributes that are not actually
-        set, have `None` value.
+        set, have `None` value. The only exception are special (dunder) names, that raise
+        `AttributeError` as usual, so protocol lookups (like `__notes__`) work correctly.
 
     Example::
 
@@ -78,12 +82,13 @@ class Error(Exception):
         for name, value in kwargs.items():
             setattr(self, name, value)
     def __getattr__(self, name):
-        if name == '__notes__':
-            raise AttributeError
+        if name[:2] == '__' and name[-2:] == '__':
+            raise AttributeError(name)
 
 # Singletons
 
-_singletons_ = {}
+#: Registry of singleton instances, entries are dropped together with their classes
+_singletons_: WeakValueDictionary[str, Singleton] = WeakValueDictionary()
 
 class SingletonMeta(type):
     """Metaclass for `Singleton` classes.
@@ -92,12 +97,16 @@ class SingletonMeta(type):
     returned without calling the constructor, otherwise the instance is created normally
     and stored in cache for later use.
     """
+    def __init__(cls: Singleton, name: str, bases: tuple, namespace: dict, **kwargs):
+        super().__init__(name, bases, namespace, **kwargs)
+        # Each class has its own cached instance and cache key
+        cls._singleton_key_: str = f"{cls.__module__}.{cls.__qualname__}"
+        cls._singleton_: Singleton | None = None
     def __call__(cls: Singleton, *args, **kwargs):
-        name = f"{cls.__module__}.{cls.__qualname__}"
-        obj = _singletons_.get(name)
+        obj = cls._singleton_
         if obj is None:
-            obj = super().__call__(*args, **kwargs)
-            _singletons_[name] = obj
+            obj = cls._singleton_ = super().__call__(*args, **kwargs)
+            _singletons_[cls._singleton_key_] = obj
         return obj
 
 class Singleton(metaclass=SingletonMeta):
@@ -115,11 +124,14 @@ class SentinelMeta(type):
     """Metaclass for `Sentinel`.
     """
     def __call__(cls: Sentinel, *args, **kwargs):
+        # Sentinel names are usually passed in capital letters already
+        if (obj := cls.instances.get(args[0])) is not None:
+            return obj
         name = args[0].upper()
         obj = cls.instances.get(name)
         if obj is None:
             obj = super().__call__(*args, **kwargs)
-            cls.instances[name] = obj
+            cls.instances[obj.name] = obj
         return obj
 
 class Sentinel(metaclass=SentinelMeta):
@@ -137,7 +149,7 @@ class Sentinel(metaclass=SentinelMeta):
             name: Sentinel name.
         """
         #: Sentinel name.
-        self.name = name.upper()
+        self.name = sys.intern(name.upper())
     def __str__(self):
         """Returns name.
         """
@@ -176,6 +188,7 @@ STOP: Sentinel = Sentinel('STOP')
 class Distinct(ABC):
     """Abstract base class for classes (incl. dataclasses) with distinct instances.
     """
+    __slots__ = ()
     @abstractmethod
     def get_key(self) -> Hashable:
         """Returns instance key.
@@ -193,12 +206,13 @@ class CachedDistinctMeta(ABCMeta):
     """Metaclass for CachedDistinct.
     """
     def __call__(cls: CachedDistinct, *args, **kwargs):
+        instances = cls._instances_
         key = cls.extract_key(*args, **kwargs)
-        obj = cls._instances_.get(key)
-        if obj is None:
-            obj = super().__call__(*args, **kwargs)
-            cls._instances_[key] = obj
-        return obj
+        try:
+            return instances[key]
+        except KeyError:
+            obj = instances[key] = super().__call__(*args, **kwargs)
+            return obj
 
 class CachedDistinct(Distinct, metaclass=CachedDistinctMeta):
     """Abstract `Distinct` descendant that caches instances.
@@ -245,6 +259,10 @@ class ZMQDomain(IntEnum):
     NODE = 2     # On single node (ipc or tcp loopback)
     NETWORK = 3  # Network-wide (ip address or domain name)
 
+#: ZeroMQ transport protocols by lowercase name
+_ZMQ_PROTOCOLS: dict[str, ZMQTransport] = {name.lower(): member for name, member
+                                           in ZMQTransport.__members__.items()}
+
 # Enhanced string types
 class ZMQAddress(str):
     """ZeroMQ endpoint address.
@@ -255,46 +273,58 @@ class ZMQAddress(str):
     Raises:
         ValueError: When string value passed to constructor is not a valid ZMQ endpoint address.
     """
+    __slots__ = ('_address_', '_domain_', '_protocol_')
     def __new__(cls, value: AnyStr):
         if isinstance(value, bytes):
             value = cast(bytes, value).decode('utf8')
-        if '://' in value:
-            protocol, _ = value.split('://', 1)
-            if protocol.upper() not in ZMQTransport._member_map_:
-                raise ValueError(f"Unknown protocol '{protocol}'")
-            if protocol.upper() == 'UNKNOWN':
-                raise ValueError("Invalid protocol")
-        else:
+        protocol, sep, _ = value.partition('://')
+        if not sep:
             raise ValueError("Protocol specification required")
-        return str.__new__(cls, value.lower())
+        if (transport := _ZMQ_PROTOCOLS.get(protocol.lower())) is None:
+            raise ValueError(f"Unknown protocol '{protocol}'")
+        if transport is ZMQTransport.UNKNOWN:
+            raise ValueError("Invalid protocol")
+        obj = str.__new__(cls, value.lower())
+        obj._protocol_: ZMQTransport = transport
+        obj._address_: str = obj[len(protocol) + 3:]
+        if transport is ZMQTransport.INPROC:
+            obj._domain_: ZMQDomain = ZMQDomain.LOCAL
+        elif transport is ZMQTransport.IPC:
+            obj._domain_ = ZMQDomain.NODE
+        elif transport is ZMQTransport.TCP and obj._address_.startswith(('127.0.0.1', 'localhost')):
+            obj._domain_ = ZMQDomain.NODE
+        else: # TCP, PGM, EPGM and VMCI
+            obj._domain_ = ZMQDomain.NETWORK
+        return obj
     def __repr__(self):
         return f"ZMQAddress('{self}')"
     @property
     def protocol(self) -> ZMQTransport:
         """Transport protocol.
         """
-        protocol, _ = self.split('://', 1)
-        return ZMQTransport._member_map_[protocol.upper()]
+        return self._protocol_
     @property
     def address(self) -> str:
         """Endpoint address.
         """
-        _, address = self.split('://', 1)
-        return address
+        return self._address_
     @property
     def domain(self) -> ZMQDomain:
         """Endpoint address domain.
         """
-        if self.protocol == ZMQTransport.INPROC:
-            return ZMQDomain.LOCAL
-        if self.protocol == ZMQTransport.IPC:
-            return ZMQDomain.NODE
-        if self.protocol == ZMQTransport.TCP:
-            if self.address.startswith('127.0.0.1') or self.address.lower().startswith('localhost'):
-                return ZMQDomain.NODE
-            return ZMQDomain.NETWORK
-        # PGM, EPGM and VMCI
-        return ZMQDomain.NETWORK
+        return self._domain_
+
+@lru_cache(maxsize=256)
+def _parse_mime(value: str) -> tuple[int, int, bool]:
+    """Returns tuple with positions of type/subtype separator and start of parameters
+    (-1 if there are no parameters) in MIME type specification, and indicator whether
+    parameters are valid.
+    """
+    fp = value.find(';')
+    bs = value.find('/', 0, len(value) if fp == -1 else fp)
+    if bs == -1:
+        raise ValueError("MIME type specification must be 'type/subtype[;param=value;...]'")
+    return bs, fp, fp == -1 or all('=' in param for param in value[fp + 1:].split(';'))
 
 class MIME(str):
     """MIME type specification.
@@ -303,20 +333,19 @@ class MIME(str):
     additional R/O properties and meaningful `repr()`.
 
     """
+    __slots__ = ('_bs_', '_fp_', '_params_')
     #: Supported MIME types
     MIME_TYPES: ClassVar[list[str]] = ['text', 'image', 'audio', 'video', 'application', 'multipart', 'message']
     def __new__(cls, value: AnyStr):
-        dfm = list(value.split(';'))
-        mime_type: str = dfm.pop(0)
-        if (i := mime_type.find('/')) == -1:
-            raise ValueError("MIME type specification must be 'type/subtype[;param=value;...]'")
-        if mime_type[:i] not in cls.MIME_TYPES:
-            raise ValueError(f"MIME type '{mime_type[:i]}' not supported")
-        if [i for i in dfm if '=' not in i]:
+        bs, fp, valid_params = _parse_mime(value)
+        if (mime_type := value[:bs]) not in cls.MIME_TYPES:
+            raise ValueError(f"MIME type '{mime_type}' not supported")
+        if not valid_params:
             raise ValueError("Wrong specification of MIME type parameters")
         obj = str.__new__(cls, value)
-        obj._bs_: int = obj.find('/')
-        obj._fp_: int = obj.find(';')
+        obj._bs_: int = bs
+        obj._fp_: int = fp
+        obj._params_: dict[str, str] | None = None
         return obj
     def __repr__(self):
         return f"MIME('{self}')"
@@ -342,11 +371,46 @@ class MIME(str):
     @property
     def params(self) -> dict[str, str]:
         """MIME parameters.
+
+        Important:
+            Parameters are parsed on first access and the same dictionary is returned
+            on subsequent calls, so it must not be modified.
         """
-        if self._fp_ != -1:
-            return {k.strip(): v.strip() for k, v
-                    in (x.split('=') for x in self[self._fp_+1:].split(';'))}
-        return {}
+        if self._params_ is None:
+            if self._fp_ != -1:
+                self._params_ = {k.strip(): v.strip() for k, v
+                                 in (x.split('=') for x in self[self._fp_+1:].split(';'))}
+            else:
+                self._params_ = {}
+        return self._params_
+
+@lru_cache(maxsize=1024)
+def _compile_source(source: str, filename: str, mode: str):
+    """Returns compiled Python source. Code objects are immutable, so they could be shared
+    by all values with the same source.
+    """
+    return compile(source, filename, mode)
+
+@lru_cache(maxsize=256)
+def _compile_expr_function(expr: str, arguments: str):
+    """Returns code that defines function `expr` with given `arguments` that returns
+    the value of expression.
+    """
+    return compile(f"def expr({arguments}):\n    return {expr}", 'PyExpr', 'exec')
+
+#: Top-level function definition header
+_DEF_RE = re.compile(r'^def[ \t]+(\w+)', re.MULTILINE)
+#: Top-level class definition header
+_CLASS_RE = re.compile(r'^class[ \t]+(\w+)', re.MULTILINE)
+
+@lru_cache(maxsize=256)
+def _compile_callable(source: str):
+    """Returns tuple with compiled Python source and name of the callable it defines.
+    """
+    # Function definition takes precedence over class definition
+    if (match := _DEF_RE.search(source) or _CLASS_RE.search(source)) is None:
+        raise ValueError("Python function or class definition not found")
+    return compile(source, 'PyCallable', 'exec'), match.group(1)
 
 class PyExpr(str):
     """Source code for Python expression.
@@ -357,13 +421,13 @@ class PyExpr(str):
     Raises:
         SyntaxError: When string value is not a valid Python expression.
     """
-    _expr_ = None
+    __slots__ = ('_expr_',)
     def __new__(cls, value: str):
         new = str.__new__(cls, value)
-        new._expr_ = compile(value, 'PyExpr', 'eval')
+        new._expr_ = _compile_source(str(value), 'PyExpr', 'eval')
         return new
     def __repr__(self):
-        return f"PyExpr('{self}')"
+        return f"PyExpr({str.__repr__(self)})"
     def get_callable(self, arguments: str='', namespace: dict[str, Any] | None=None) -> Callable:
         """Returns expression as callable function ready for execution.
 
@@ -374,9 +438,7 @@ class PyExpr(str):
         ns = {}
         if namespace:
             ns.update(namespace)
-        code = compile(f"def expr({arguments}):\n    return {self}",
-                       'PyExpr', 'exec')
-        eval(code, ns) # noqa: S307
+        eval(_compile_expr_function(str(self), arguments), ns) # noqa: S307
         return ns['expr']
     @property
     def expr(self):
@@ -392,9 +454,9 @@ class PyCode(str):
     Raises:
         SyntaxError: When string value is not a valid Python code block.
     """
-    _code_ = None
+    __slots__ = ('_code_',)
     def __new__(cls, value: str):
-        code = compile(value, 'PyCode', 'exec')
+        code = _compile_source(str(value), 'PyCode', 'exec')
         new = str.__new__(cls, value)
         new._code_ = code
         return new
@@ -410,34 +472,31 @@ class PyCallable(str):
     It behaves like `str`, but checks that value is a valid Python callable (function of class
     definition), and acts like a callable (i.e. you can directly call the PyCallable value).
 
+    Important:
+        Instances do not have `__dict__`. Descendant classes should declare `__slots__`
+        (at least empty one) to keep it that way.
+
     Raises:
         ValueError: When string value does not contains the function or class definition.
         SyntaxError: When string value is not a valid Python callable.
     """
-    _callable_ = None
-    #: Name of the callable (function).
-    name: str = None
+    __slots__ = {'_callable_': None, 'name': 'Name of the callable (function).'}
     def __new__(cls, value: str):
-        callable_name = None
-        for line in value.split('\n'):
-            if line.lower().startswith('def '):
-                callable_name = line[4:line.find('(')].strip()
-                break
-        if callable_name is None:
-            for line in value.split('\n'):
-                if line.lower().startswith('class '):
-                    callable_name = line[6:line.find('(')].strip()
-                    break
-        if callable_name is None:
-            raise ValueError("Python function or class definition not found")
+        code, callable_name = _compile_callable(str(value))
         ns = {}
-        eval(compile(value, 'PyCallable', 'exec'), ns) # noqa: S307
+        eval(code, ns) # noqa: S307
         new = str.__new__(cls, value)
         new._callable_ = ns[callable_name]
         new.name = callable_name
         return new
     def __call__(self, *args, **kwargs):
         return self._callable_(*args, **kwargs)
+    @property
+    def callable(self) -> Callable:
+        """Function or class defined by source code. Use it to avoid call indirection
+        when the callable is used repeatedly.
+        """
+        return self._callable_
 
 # Metaclasses
 def conjunctive(name, bases, attrs):
@@ -457,15 +516,23 @@ def conjunctive(name, bases, attrs):
 
         class CC(AA, BB, metaclass=Conjunctive): pass
     """
-    basemetaclasses = []
-    for base in bases:
-        metacls = type(base)
-        if isinstance(metacls, type) and metacls is not type and metacls not in basemetaclasses:
-            basemetaclasses.append(metacls)
-    dynamic = type(''.join(b.__name__ for b in basemetaclasses), tuple(basemetaclasses), {})
+    # dict keeps the order of base classes while removing duplicates
+    basemetaclasses = tuple({type(base): None for base in bases if type(base) is not type})
+    if not basemetaclasses:
+        return type(name, bases, attrs)
+    if len(basemetaclasses) == 1:
+        return basemetaclasses[0](name, bases, attrs)
+    dynamic = type(''.join(b.__name__ for b in basemetaclasses), basemetaclasses, {})
     return dynamic(name, bases, attrs)
 
 # Functions
+@lru_cache(maxsize=256)
+def _parse_load_spec(spec: str) -> tuple[str, attrgetter]:
+    """Returns tuple with module name and getter for object within the module.
+    """
+    module_spec, name = spec.split(':')
+    return module_spec, attrgetter(name)
+
 def load(spec: str) -> Any:
     """Return object from module. Module is imported if necessary.
 
@@ -473,13 +540,8 @@ def load(spec: str) -> Any:
         spec: Object specification in format `module[.submodule...]:object_name[.object_name...]`
 
     """
-    module_spec, name = spec.split(':')
-    if module_spec in sys.modules:
-        module = sys.modules[module_spec]
-    else:
+    module_spec, getter = _parse_load_spec(spec)
+    if (module := sys.modules.get(module_spec)) is None:
         module = import_module(module_spec)
-    result = module
-    for item in name.split('.'):
-        result = getattr(result, item)
-    return result
+    return getter(module)
 
@@ -48,15 +48,22 @@ BAD_S = "bad_value"
 EMPTY_S = "empty"
 
 
-@pytest.fixture
-def proto() -> config.ConfigProto:
-    """Returns config protobuf message.
+@pytest.fixture(scope="module")
+def module_proto() -> config.ConfigProto:
+    """Returns config protobuf message shared by all tests in module.
     """
     return config.ConfigProto()
 
 @pytest.fixture
-def base_conf() -> ConfigParser:
-    """Returns configparser with `EnvExtendedInterpolation`.
+def proto(module_proto) -> config.ConfigProto:
+    """Returns empty config protobuf message.
+    """
+    module_proto.Clear()
+    return module_proto
+
+@pytest.fixture(scope="module")
+def module_conf() -> ConfigParser:
+    """Returns configparser with `EnvExtendedInterpolation` shared by all tests in module.
     """
     return ConfigParser(interpolation=config.EnvExtendedInterpolation())
 
@@ -53,8 +53,8 @@ DEFAULT_VAL = NO
 DEFAULT_OPT_VAL = NO
 NEW_VAL = YES
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -65,9 +65,9 @@ option_name = yes
 [%(BAD)s]
 option_name = bad_value
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.BoolOption("option_name", "description")
@@ -163,7 +163,7 @@ def test_proto(conf, proto):
     proto_value = YES
     opt.set_value(proto_value)
     proto.options["option_name"].as_bool = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -171,7 +171,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -91,8 +91,8 @@ Has three options and two sub-configs.
         self.master_db: DbConfig = DbConfig("master-db")
         self.backup_db: DbConfig = DbConfig("backup-db")
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -121,9 +121,9 @@ database = two
 [%(ABSENT)s]
 [%(BAD)s]
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_basics(conf):
     cfg = SimpleConfig()
@@ -75,8 +75,8 @@ PRESENT_VAL = SimpleDataclass("master", 3, SimpleEnum.RUNNING)
 DEFAULT_OPT_VAL = SimpleDataclass("default")
 NEW_VAL = SimpleDataclass("master", 3, SimpleEnum.STOPPED)
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -94,9 +94,9 @@ option_name = bad_value
 [illegal]
 option_name = 1000
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.DataclassOption("option_name", SimpleDataclass, "description")
@@ -192,7 +192,7 @@ def test_proto(conf, proto):
     proto_value = SimpleDataclass("backup", 2, SimpleEnum.FINISHED)
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = "name:backup,priority:2,state:FINISHED"
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -204,7 +204,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
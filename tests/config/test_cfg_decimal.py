@@ -54,8 +54,8 @@ DEFAULT_OPT_VAL = Decimal("3000.0")
 NEW_VAL = Decimal("0.0")
 
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -66,9 +66,9 @@ option_name = 500
 [%(BAD)s]
 option_name = bad_value
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.DecimalOption("option_name", "description")
@@ -161,7 +161,7 @@ def test_proto(conf, proto):
     proto_value = Decimal("800000.0")
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = str(proto_value)
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -169,7 +169,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     #
     proto.options["option_name"].as_uint64 = 10
     opt.load_proto(proto)
@@ -68,8 +68,8 @@ PRESENT_VAL = SimpleEnum.RUNNING
 DEFAULT_OPT_VAL = SimpleEnum.READY
 NEW_VAL = SimpleEnum.STOPPED
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -84,9 +84,9 @@ option_name = bad_value
 [illegal]
 option_name = 1000
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.EnumOption("option_name", SimpleEnum, "description")
@@ -177,6 +177,11 @@ def test_allowed_values(conf):
     with pytest.raises(ValueError) as cm:
         opt.set_value(NEW_VAL)
     assert cm.value.args == ("Value '<SimpleEnum.SUSPENDED: 4>' not allowed",)
+    # Reassigned allowed values are respected
+    opt.allowed = [SimpleEnum.UNKNOWN]
+    with pytest.raises(ValueError) as cm:
+        opt.set_value(SimpleEnum.RUNNING)
+    assert cm.value.args == ("Value '<SimpleEnum.RUNNING: 2>' not allowed",)
 
 def test_default(conf):
     opt = config.EnumOption("option_name", SimpleEnum, "description", default=DEFAULT_OPT_VAL)
@@ -207,7 +212,7 @@ def test_proto(conf, proto):
     proto_value = SimpleEnum.READY
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = proto_value.name
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -219,7 +224,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
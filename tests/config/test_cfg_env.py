@@ -43,8 +43,8 @@ from firebird.base import config
 from firebird.base.types import Error
 
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[base]
@@ -58,8 +58,8 @@ value_env_1 = ${env:mysecret}
 value_env_2 = ${env:not-present}
 value_env_path = ${env:path}
 """
-    base_conf.read_string(conf_str)
-    return base_conf
+    module_conf.read_string(conf_str)
+    return module_conf
 
 def test_01(conf, monkeypatch):
     monkeypatch.setenv("MYSECRET", "secret")
@@ -70,8 +70,8 @@ DEFAULT_OPT_VAL = SimpleIntFlag.THREE | SimpleIntFlag.FOUR
 NEW_VAL = SimpleIntFlag.FIVE
 
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -86,9 +86,9 @@ option_name = bad_value
 [illegal]
 option_name = 1000
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.FlagOption("option_name", SimpleIntFlag, "description")
@@ -184,6 +184,11 @@ def test_allowed_values(conf):
     with pytest.raises(ValueError) as cm:
         opt.set_value(NEW_VAL)
     assert cm.value.args == ("Illegal value '16' for flag option 'option_name'",)
+    # Reassigned allowed values are respected
+    opt.allowed = [SimpleIntFlag.ONE]
+    with pytest.raises(ValueError) as cm:
+        opt.set_value(SimpleIntFlag.TWO)
+    assert cm.value.args == ("Illegal value '2' for flag option 'option_name'",)
 
 def test_default(conf):
     opt = config.FlagOption("option_name", SimpleIntFlag, "description", default=DEFAULT_OPT_VAL)
@@ -214,7 +219,7 @@ def test_proto(conf, proto):
     proto_value = SimpleIntFlag.FIVE
     opt.set_value(proto_value)
     proto.options["option_name"].as_uint64 = proto_value.value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -226,7 +231,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -51,8 +51,8 @@ DEFAULT_VAL = 10
 DEFAULT_OPT_VAL = 3000
 NEW_VAL = 0
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -63,9 +63,9 @@ option_name = 500
 [%(BAD)s]
 option_name = bad_value
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.IntOption("option_name", "description")
@@ -169,7 +169,7 @@ def test_proto(conf, proto):
     proto_value = 800000
     opt.set_value(proto_value)
     proto.options["option_name"].as_uint64 = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -177,7 +177,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -202,7 +202,7 @@ def test_proto(conf, proto):
     proto_value = -800000
     opt.set_value(proto_value)
     proto.options["option_name"].as_sint64 = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -210,7 +210,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
 
 def test_get_config(conf):
     opt = config.IntOption("option_name", "description", default=DEFAULT_OPT_VAL)
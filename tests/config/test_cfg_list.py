@@ -35,6 +35,7 @@
 
 from __future__ import annotations
 
+from configparser import ConfigParser
 from decimal import Decimal
 from enum import IntEnum
 from uuid import UUID
@@ -84,8 +85,7 @@ class StrParams:
         x = (self.ITEM_TYPE, ) if isinstance(self.ITEM_TYPE, type) else self.ITEM_TYPE
         self.TYPE_NAMES = ", ".join(t.__name__ for t in x)
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(self.LONG_VAL)
         self.conf_str = """[%(DEFAULT)s]
 option_name = DEFAULT_value
 [%(PRESENT)s]
@@ -108,10 +108,9 @@ class IntParams(StrParams):
     ITEM_TYPE = int
     PROTO_VALUE = [30, 40, 50]
     PROTO_VALUE_STR = "30,40,50"
-    LONG_VAL = [x for x in range(50)]
+    LONG_VAL = list(range(50))
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(str(x) for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(map(str, self.LONG_VAL))
         self.BAD_MSG = ("invalid literal for int() with base 10: 'this is not an integer'",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = 0
@@ -135,8 +134,7 @@ class FloatParams(StrParams):
     PROTO_VALUE_STR = "30.3,40.4,50.5"
     LONG_VAL = [x / 1.5 for x in range(50)]
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(str(x) for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(map(str, self.LONG_VAL))
         self.BAD_MSG = ("could not convert string to float: 'this is not a float'",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = 0.0
@@ -160,8 +158,7 @@ class DecimalParams(StrParams):
     PROTO_VALUE_STR = "30.3,40.4,50.5"
     LONG_VAL = [Decimal(str(x / 1.5)) for x in range(50)]
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(str(x) for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(map(str, self.LONG_VAL))
         self.BAD_MSG = ("could not convert string to Decimal: 'this is not a decimal'",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = 0.0
@@ -185,8 +182,7 @@ class BoolParams(StrParams):
     PROTO_VALUE_STR = "no,yes,no"
     LONG_VAL = [bool(x % 2) for x in range(40)]
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(convert_to_str(x) for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(map(convert_to_str, self.LONG_VAL))
         self.BAD_MSG = ("Value is not a valid bool string constant",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = 0
@@ -211,10 +207,9 @@ class UUIDParams(StrParams):
     ITEM_TYPE = UUID
     PROTO_VALUE = [UUID("3a3e68cc-256e-11ea-ad1d-5404a6a1fd6e"), UUID("3521db30-256e-11ea-ad1d-5404a6a1fd6e")]
     PROTO_VALUE_STR = "3a3e68cc-256e-11ea-ad1d-5404a6a1fd6e,3521db30-256e-11ea-ad1d-5404a6a1fd6e"
-    LONG_VAL = [UUID("2f02868c-256e-11ea-ad1d-5404a6a1fd6e") for x in range(10)]
+    LONG_VAL = [UUID("2f02868c-256e-11ea-ad1d-5404a6a1fd6e")] * 10
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(str(x) for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(map(str, self.LONG_VAL))
         self.BAD_MSG = ("badly formed hexadecimal UUID string",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = eeb7f94a-256d-11ea-ad1d-5404a6a1fd6e
@@ -239,10 +234,9 @@ class MIMEParams(StrParams):
     ITEM_TYPE = MIME
     PROTO_VALUE = [MIME("application/octet-stream"), MIME("video/mp4")]
     PROTO_VALUE_STR = "application/octet-stream,video/mp4"
-    LONG_VAL = [MIME("text/html;charset=win1250") for x in range(10)]
+    LONG_VAL = [MIME("text/html;charset=win1250")] * 10
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(x for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(self.LONG_VAL)
         self.BAD_MSG = ("MIME type specification must be 'type/subtype[;param=value;...]'",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = application/octet-stream
@@ -268,10 +262,9 @@ class ZMQAddressParams(StrParams):
     ITEM_TYPE = ZMQAddress
     PROTO_VALUE = [ZMQAddress("tcp://www.firebirdsql.org:8001"), ZMQAddress("tcp://www.firebirdsql.org:9001")]
     PROTO_VALUE_STR = "tcp://www.firebirdsql.org:8001,tcp://www.firebirdsql.org:9001"
-    LONG_VAL = [ZMQAddress("tcp://www.firebirdsql.org:500") for x in range(10)]
+    LONG_VAL = [ZMQAddress("tcp://www.firebirdsql.org:500")] * 10
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(x for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(self.LONG_VAL)
         self.BAD_MSG = ("Protocol specification required",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = tcp://127.0.0.1:*
@@ -302,8 +295,7 @@ class MultiTypeParams(StrParams):
                 MIME("application/octet-stream"),
                 "=" * 30, 1, True, 10.1, Decimal("20.20")]
     def prepare(self):
-        x = "\n   "
-        self.LONG_PRINT = f"\n   {x.join(convert_to_str(x) for x in self.LONG_VAL)}"
+        self.LONG_PRINT = "\n   " + "\n   ".join(map(convert_to_str, self.LONG_VAL))
         self.BAD_MSG = ("Item type 'bin' not supported",)
         self.conf_str = """[%(DEFAULT)s]
 option_name = str:DEFAULT_value
@@ -325,8 +317,8 @@ option_name = str:this is string, int:20, bin:100110111
 params = [StrParams, IntParams, FloatParams, DecimalParams, BoolParams, UUIDParams,
           MIMEParams, ZMQAddressParams, MultiTypeParams]
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -339,28 +331,18 @@ option_name =
 [%(BAD)s]
 option_name =
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
-@pytest.fixture(params=params)
-def xx(base_conf, request):
+@pytest.fixture(scope="module", params=params)
+def xx(request):
     """Parameters for List tests.
     """
     data = request.param()
-    data.conf = base_conf
-    conf_str = """[%(DEFAULT)s]
-option_name = DEFAULT_value
-[%(PRESENT)s]
-option_name =
-  present_value_1
-  present_value_2
-[%(ABSENT)s]
-[%(BAD)s]
-option_name =
-"""
-    base_conf.read_string(data.conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    data.conf = ConfigParser(interpolation=config.EnvExtendedInterpolation())
+    data.conf.read_string(data.conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                           "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
     return data
 
 def test_simple(xx):
@@ -467,7 +449,7 @@ def test_proto(xx, proto):
     proto_value = xx.PROTO_VALUE
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = xx.PROTO_VALUE_STR
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -475,7 +457,7 @@ def test_proto(xx, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
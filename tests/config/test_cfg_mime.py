@@ -59,8 +59,8 @@ NEW_VAL = MIME("application/x.fb.proto;type=firebird.butler.fbsd.ErrorDescriptio
 NEW_TYPE = "application/x.fb.proto"
 NEW_PARS = {"type": "firebird.butler.fbsd.ErrorDescription"}
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -75,9 +75,9 @@ option_name = model/vml
 [bad_mime_parameters]
 option_name = text/plain;charset/utf-8
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt: config.MIMEOption = config.MIMEOption("option_name", "description")
@@ -204,7 +204,7 @@ def test_proto(conf, proto):
     proto_value = NEW_VAL
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert opt.value.mime_type == NEW_TYPE
@@ -214,7 +214,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -54,8 +54,8 @@ DEFAULT_VAL = Path("c:\\home\\default" if platform.system == "Windows" else "/ho
 DEFAULT_OPT_VAL = Path("c:\\home\\default-opt" if platform.system == "Windows" else "/home/default-opt")
 NEW_VAL = Path("c:\\home\\new" if platform.system == "Windows" else "/home/new")
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = f"""[%(DEFAULT)s]
@@ -66,9 +66,9 @@ option_name = {PRESENT_VAL}
 [%(BAD)s]
 option_name =
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.PathOption("option_name", "description")
@@ -160,7 +160,7 @@ def test_proto(conf, proto):
     proto_value = Path("c:\\home\\proto" if platform.system == "Windows" else "/home/proto")
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = str(proto_value)
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -168,7 +168,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -56,8 +56,10 @@ NEW_VAL = PyCallable("\ndef foo(value: int) -> int:\n    return value * 3")
 def foo_func(value: int) -> int:
     ...
 
-@pytest.fixture
-def conf(base_conf):
+FOO_SIGNATURE = signature(foo_func)
+
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -76,12 +78,12 @@ option_name =
     | def bad_foo(value, value_2)->int:
     |     return value * value_2
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
-    for opt in (config.PyCallableOption("option_name", "description", signature=signature(foo_func)),
+    for opt in (config.PyCallableOption("option_name", "description", signature=FOO_SIGNATURE),
                 config.PyCallableOption("option_name", "description", signature=foo_func),
                 config.PyCallableOption("option_name", "description", signature="foo_func(value: int) -> int")):
         assert opt.name == "option_name"
@@ -114,7 +116,7 @@ def test_simple(conf):
     assert isinstance(opt.value, opt.datatype)
 
 def test_required(conf):
-    opt = config.PyCallableOption("option_name", "description", signature=signature(foo_func),
+    opt = config.PyCallableOption("option_name", "description", signature=FOO_SIGNATURE,
                                   required=True)
     assert opt.name == "option_name"
     assert opt.datatype == PyCallable
@@ -141,7 +143,7 @@ def test_required(conf):
     assert opt.value == NEW_VAL
 
 def test_bad_value(conf):
-    opt = config.PyCallableOption("option_name", "description", signature=signature(foo_func))
+    opt = config.PyCallableOption("option_name", "description", signature=FOO_SIGNATURE)
     with pytest.raises(ValueError) as cm:
         opt.load_config(conf, BAD_S)
     assert cm.value.args == ("Python function or class definition not found",)
@@ -159,7 +161,7 @@ def test_bad_value(conf):
     assert cm.value.args == ("Option 'option_name' value must be a 'PyCallable', not 'float'",)
 
 def test_default(conf):
-    opt = config.PyCallableOption("option_name", "description", signature=signature(foo_func),
+    opt = config.PyCallableOption("option_name", "description", signature=FOO_SIGNATURE,
                                   default=DEFAULT_OPT_VAL)
     assert opt.name == "option_name"
     assert opt.datatype == PyCallable
@@ -184,12 +186,12 @@ def test_default(conf):
     assert opt.value == NEW_VAL
 
 def test_proto(conf, proto):
-    opt = config.PyCallableOption("option_name", "description", signature=signature(foo_func),
+    opt = config.PyCallableOption("option_name", "description", signature=FOO_SIGNATURE,
                                   default=DEFAULT_OPT_VAL)
     proto_value = "\ndef foo(value: int) -> int:\n    return value * 100"
     opt.set_value(PyCallable(proto_value))
     proto.options["option_name"].as_string = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -197,7 +199,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -213,7 +215,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
 
 def test_get_config(conf):
-    opt = config.PyCallableOption("option_name", "description", signature=signature(foo_func),
+    opt = config.PyCallableOption("option_name", "description", signature=FOO_SIGNATURE,
                                   default=DEFAULT_OPT_VAL)
     lines = """; description
 ; Type: PyCallable
@@ -53,8 +53,8 @@ PRESENT_VAL = PyCode('\ndef pp(value):\n    print("Value:",value,file=output)\n\
 DEFAULT_OPT_VAL = PyCode("DEFAULT")
 NEW_VAL = PyCode('print("NEW value")')
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -70,9 +70,9 @@ option_name =
 [%(BAD)s]
 option_name = This is not a valid Python code block
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.PyCodeOption("option_name", "description")
@@ -169,7 +169,7 @@ def test_proto(conf, proto):
     proto_value = PyCode("proto_value")
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -177,7 +177,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     proto.Clear()
     opt.clear()
     opt.save_proto(proto)
@@ -64,8 +64,8 @@ MULTIFMT = PyExpr("""this.value in [
 class ValueHolder:
     "Simple values holding object"
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -76,9 +76,9 @@ option_name = this.value in [1, 2, 3]
 [%(BAD)s]
 option_name = This is not a valid Python expression
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.PyExprOption("option_name", "description")
@@ -186,7 +186,7 @@ def test_proto(conf, proto):
         proto.Clear()
         opt.set_value(proto_value)
         proto.options["option_name"].as_string = proto_value
-        proto_dump = str(proto)
+        proto_dump = proto.SerializeToString(deterministic=True)
         opt.load_proto(proto)
         assert opt.value == proto_value
         assert isinstance(opt.value, opt.datatype)
@@ -194,7 +194,7 @@ def test_proto(conf, proto):
         assert "option_name" not in proto.options
         opt.save_proto(proto)
         assert "option_name" in proto.options
-        assert str(proto) == proto_dump
+        assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
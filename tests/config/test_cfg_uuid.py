@@ -53,8 +53,8 @@ DEFAULT_VAL = UUID("e3a57070-de0d-11e9-9b5b-5404a6a1fd6e")
 DEFAULT_OPT_VAL = UUID("ede5cc42-de0d-11e9-9b5b-5404a6a1fd6e")
 NEW_VAL = UUID("92ef5c08-de0e-11e9-9b5b-5404a6a1fd6e")
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -66,9 +66,9 @@ option_name = fbcdd0acde0d11e99b5b5404a6a1fd6e
 [%(BAD)s]
 option_name = BAD_UID
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.UUIDOption("option_name", "description")
@@ -162,7 +162,7 @@ def test_proto(conf, proto):
     opt.set_value(proto_value)
     # as_bytes (default)
     proto.options["option_name"].as_bytes = proto_value.bytes
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -177,7 +177,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
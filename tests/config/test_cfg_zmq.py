@@ -51,8 +51,8 @@ DEFAULT_VAL = ZMQAddress("tcp://127.0.0.1:*")
 DEFAULT_OPT_VAL = ZMQAddress("tcp://127.0.0.1:8001")
 NEW_VAL = ZMQAddress("inproc://my-address")
 
-@pytest.fixture
-def conf(base_conf):
+@pytest.fixture(scope="module")
+def conf(module_conf):
     """Returns configparser initialized with data.
     """
     conf_str = """[%(DEFAULT)s]
@@ -63,9 +63,9 @@ option_name = ipc://@my-address
 [%(BAD)s]
 option_name = bad_value
 """
-    base_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
-                                      "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
-    return base_conf
+    module_conf.read_string(conf_str % {"DEFAULT": DEFAULT_S, "PRESENT": PRESENT_S,
+                                        "ABSENT": ABSENT_S, "BAD": BAD_S, "EMPTY": EMPTY_S,})
+    return module_conf
 
 def test_simple(conf):
     opt = config.ZMQAddressOption("option_name", "description")
@@ -158,7 +158,7 @@ def test_proto(conf, proto):
     proto_value = ZMQAddress("inproc://proto-address")
     opt.set_value(proto_value)
     proto.options["option_name"].as_string = proto_value
-    proto_dump = str(proto)
+    proto_dump = proto.SerializeToString(deterministic=True)
     opt.load_proto(proto)
     assert opt.value == proto_value
     assert isinstance(opt.value, opt.datatype)
@@ -166,7 +166,7 @@ def test_proto(conf, proto):
     assert "option_name" not in proto.options
     opt.save_proto(proto)
     assert "option_name" in proto.options
-    assert str(proto) == proto_dump
+    assert proto.SerializeToString(deterministic=True) == proto_dump
     # empty proto
     opt.clear(to_default=False)
     proto.Clear()
@@ -45,6 +45,14 @@ factories = [BytesBufferFactory, CTypesBufferFactory]
 def factory(request):
     return request.param
 
+#: Number sizes used in read/write tests, including atypical ones
+number_sizes = [1, 2, 4, 8, 3, 12]
+
+def number_bytes(size: int, byteorder: ByteOrder) -> bytes:
+    "Returns 255 stored as number of given size and byte order"
+    data = b"\xff" + b"\x00" * (size - 1)
+    return data if byteorder is ByteOrder.LITTLE else data[::-1]
+
 def test_create_empty(factory):
     buf = MemoryBuffer(0, factory=factory)
     assert buf.pos == 0
@@ -102,8 +110,7 @@ def test_clear_empty(factory):
 
 def test_clear_sized(factory):
     buf = MemoryBuffer(10, factory=factory)
-    for i in range(buf.buffer_size):
-        buf.raw[i] = 255
+    buf.raw[:] = b"\xff" * buf.buffer_size
     assert buf.get_raw() == b"\xff" * 10
     buf.clear()
     assert buf.pos == 0
@@ -148,77 +155,21 @@ def test_write_bigint(factory):
     assert buf.get_raw() == b"\x04\x00\x00\x00\x00\x00\x00\x00"
     assert buf.is_eof()
 
-def test_write_number(factory):
-    buf = MemoryBuffer(0, factory=factory)
-    buf.write_number(255, 1)
-    assert buf.pos == 1
-    assert buf.get_raw() == b"\xff"
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(0, factory=factory)
-    buf.write_number(255, 2)
-    assert buf.pos == 2
-    assert buf.get_raw() == b"\xff\x00"
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(0, factory=factory)
-    buf.write_number(255, 4)
-    assert buf.pos == 4
-    assert buf.get_raw() == b"\xff\x00\x00\x00"
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(0, factory=factory)
-    buf.write_number(255, 8)
-    assert buf.pos == 8
-    assert buf.get_raw() == b"\xff\x00\x00\x00\x00\x00\x00\x00"
-    assert buf.is_eof()
-    # Atypical sizes
-    buf = MemoryBuffer(0, factory=factory)
-    buf.write_number(255, 3)
-    assert buf.pos == 3
-    assert buf.get_raw() == b"\xff\x00\x00"
-    assert buf.is_eof()
-    buf = MemoryBuffer(0, factory=factory)
-    buf.write_number(255, 12)
-    assert buf.pos == 12
-    assert buf.get_raw() == b"\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"
+@pytest.mark.parametrize("byteorder", [ByteOrder.LITTLE, ByteOrder.BIG])
+@pytest.mark.parametrize("size", number_sizes)
+def test_write_number(factory, byteorder, size):
+    buf = MemoryBuffer(0, factory=factory, byteorder=byteorder)
+    buf.write_number(255, size)
+    assert buf.pos == size
+    assert buf.get_raw() == number_bytes(size, byteorder)
     assert buf.is_eof()
 
-def test_write_number_big_endian(factory):
-    buf = MemoryBuffer(0, factory=factory, byteorder=ByteOrder.BIG)
-    buf.write_number(255, 1)
-    assert buf.pos == 1
-    assert buf.get_raw() == b"\xff"
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(0, factory=factory, byteorder=ByteOrder.BIG)
-    buf.write_number(255, 2)
-    assert buf.pos == 2
-    assert buf.get_raw() == b"\x00\xff"
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(0, factory=factory, byteorder=ByteOrder.BIG)
-    buf.write_number(255, 4)
-    assert buf.pos == 4
-    assert buf.get_raw() == b"\x00\x00\x00\xff"
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(0, factory=factory, byteorder=ByteOrder.BIG)
-    buf.write_number(255, 8)
-    assert buf.pos == 8
-    assert buf.get_raw() == b"\x00\x00\x00\x00\x00\x00\x00\xff"
-    assert buf.is_eof()
-    # Atypical sizes
-    buf = MemoryBuffer(0, factory=factory, byteorder=ByteOrder.BIG)
-    buf.write_number(255, 3)
-    assert buf.pos == 3
-    assert buf.get_raw() == b"\x00\x00\xff"
-    assert buf.is_eof()
-    buf = MemoryBuffer(0, factory=factory, byteorder=ByteOrder.BIG)
-    buf.write_number(255, 12)
-    assert buf.pos == 12
-    assert buf.get_raw() == b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff"
-    assert buf.is_eof()
+def test_write_number_overflow(factory):
+    buf = MemoryBuffer(0, factory=factory)
+    with pytest.raises(OverflowError):
+        buf.write_number(256, 1)
+    assert buf.pos == 0
+    assert len(buf.raw) == 0
 
 def test_write_string(factory):
     buf = MemoryBuffer(0, factory=factory)
@@ -282,68 +233,12 @@ def test_read_bigint(factory):
     assert buf.get_raw() == b"\x04\x00\x00\x00\x00\x00\x00\x00"
     assert buf.is_eof()
 
-def test_read_number(factory):
-    buf = MemoryBuffer(b"\xff", factory=factory)
-    assert buf.read_number(1) == 255
-    assert buf.pos == 1
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\xff\x00", factory=factory)
-    assert buf.read_number(2) == 255
-    assert buf.pos == 2
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\xff\x00\x00\x00", factory=factory)
-    assert buf.read_number(4) == 255
-    assert buf.pos == 4
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\xff\x00\x00\x00\x00\x00\x00\x00", factory=factory)
-    assert buf.read_number(8) == 255
-    assert buf.pos == 8
-    assert buf.is_eof()
-    # Atypical sizes
-    buf = MemoryBuffer(b"\xff\x00\x00", factory=factory)
-    assert buf.read_number(3) == 255
-    assert buf.pos == 3
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00", factory=factory)
-    assert buf.read_number(12) == 255
-    assert buf.pos == 12
-    assert buf.is_eof()
-
-def test_read_number_big_endian(factory):
-    buf = MemoryBuffer(b"\xff", factory=factory, byteorder=ByteOrder.BIG)
-    assert buf.read_number(1) == 255
-    assert buf.pos == 1
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\x00\xff", factory=factory, byteorder=ByteOrder.BIG)
-    assert buf.read_number(2) == 255
-    assert buf.pos == 2
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\x00\x00\x00\xff", factory=factory, byteorder=ByteOrder.BIG)
-    assert buf.read_number(4) == 255
-    assert buf.pos == 4
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\x00\x00\x00\x00\x00\x00\x00\xff", factory=factory,
-                       byteorder=ByteOrder.BIG)
-    assert buf.read_number(8) == 255
-    assert buf.pos == 8
-    assert buf.is_eof()
-    # Atypical sizes
-    buf = MemoryBuffer(b"\x00\x00\xff", factory=factory, byteorder=ByteOrder.BIG)
-    assert buf.read_number(3) == 255
-    assert buf.pos == 3
-    assert buf.is_eof()
-    #
-    buf = MemoryBuffer(b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff", factory=factory,
-                       byteorder=ByteOrder.BIG)
-    assert buf.read_number(12) == 255
-    assert buf.pos == 12
+@pytest.mark.parametrize("byteorder", [ByteOrder.LITTLE, ByteOrder.BIG])
+@pytest.mark.parametrize("size", number_sizes)
+def test_read_number(factory, byteorder, size):
+    buf = MemoryBuffer(number_bytes(size, byteorder), factory=factory, byteorder=byteorder)
+    assert buf.read_number(size) == 255
+    assert buf.pos == size
     assert buf.is_eof()
 
 def test_read_sized_int(factory):
@@ -604,6 +604,23 @@ def test_registry_dict_access(data_items):
     with pytest.raises(KeyError):
         r["NOT IN REGISTRY"]
 
+def test_registry_virtual_distinct(data_items):
+    class Virtual:
+        def __init__(self, key):
+            self.key = key
+        def get_key(self):
+            return self.key
+
+    Distinct.register(Virtual)
+    v = Virtual(100)
+    r = Registry(data_items)
+    r.store(v)
+    assert r[v] is v
+    assert v in r
+    assert r.get(v) is v
+    assert r.pop(v) is v
+    assert v not in r
+
 def test_registry_dict_update(data_items, data_desc):
     i1 = data_items[0]
     d1 = data_desc[0]
@@ -36,13 +36,15 @@
 from __future__ import annotations
 
 import os
+from configparser import ConfigParser
 from logging import Formatter, LogRecord, getLogger, lastResort
 
 import pytest
 
+import firebird.base.trace as fbtrace
 from firebird.base.logging import LogLevel, get_agent_name, logging_manager
 from firebird.base.strconv import convert_from_str
-from firebird.base.trace import TracedMixin, TraceFlag, add_trace, trace_manager, traced
+from firebird.base.trace import TracedMixin, TraceFlag, add_trace, remove_trace, trace_manager, traced
 from firebird.base.types import *
 
 ## TODO:
@@ -83,6 +85,9 @@ class Traced(TracedMixin):
         getLogger().info("<traced_raises>")
         raise Error("No cookies left")
 
+class TracedDescendant(Traced):
+    "traceable descendant"
+
 class DecoratedTraced:
     "traceable callables"
     def __init__(self, logging_id: str=None):
@@ -112,6 +117,7 @@ class DecoratedTraced:
 def ensure_trace(monkeypatch):
     if not __debug__:
         monkeypatch.setenv("FBASE_TRACE", "on")
+        monkeypatch.setattr(fbtrace, "_trace_enabled", True)
     logging_manager.logger_fmt = ["trace"]
     #
     trace_manager.clear()
@@ -273,6 +279,50 @@ def test_custom_msg(caplog):
     verify(caplog.records, "ENTER traced_raises ()",
            "!!! traced_raises: Error: No cookies left", "")
 
+def test_static_msg(caplog):
+    def verify(records, msg_before: str, msg_after: str) -> None:
+        assert len(records) == 3
+        assert records.pop(0).message == msg_before
+        records.pop(0)
+        assert records.pop(0).message == msg_after
+
+    ctx = Traced()
+    trace_manager.flags |= (TraceFlag.FAIL | TraceFlag.BEFORE | TraceFlag.AFTER)
+    #
+    with caplog.at_level(level="DEBUG"):
+        d = traced(msg_before="ENTER", msg_after="EXIT")
+        d(ctx.traced_param_result)(1, 2, kw_only="NO-DEFAULT")
+    verify(caplog.records, "ENTER", "EXIT")
+    with caplog.at_level(level="DEBUG"):
+        d = traced(msg_before="ENTER {pos}", msg_after="EXIT {_result_}", max_param_length=2)
+        d(ctx.traced_param_result)(1, "0123", kw_only="NO-DEFAULT")
+    verify(caplog.records, "ENTER 01..[2]", "EXIT OK")
+    with caplog.at_level(level="DEBUG"):
+        d = traced(msg_before="ENTER", msg_failed="FAILED {_exc_}")
+        with pytest.raises(Error):
+            d(ctx.traced_raises)()
+    verify(caplog.records, "ENTER", "FAILED Error: No cookies left")
+
+def test_log_override(caplog):
+    "Overridden log methods get all parameters even if messages do not use them"
+    seen = []
+    class custom_traced(traced): # noqa: N801
+        def log_before(self, logger, params):
+            seen.append(params.get("pos"))
+            params["pos"] = None
+            super().log_before(logger, params)
+
+    def foo(pos):
+        pass
+
+    trace_manager.flags |= TraceFlag.BEFORE
+    with caplog.at_level(level="DEBUG"):
+        custom_traced(msg_before="ENTER")(foo)(42)
+        custom_traced(msg_before="ENTER")(foo)(43)
+        traced(msg_before="ENTER")(foo)(44)
+    assert seen == [42, 43]
+    assert [rec.message for rec in caplog.records] == ["ENTER", "ENTER", "ENTER"]
+
 def test_extra(caplog):
     def foo(bar=""):
         return f"Foo{bar}!"
@@ -390,20 +440,40 @@ def test_env(caplog, monkeypatch):
     assert len(caplog.records) == 3
     caplog.clear()
     with monkeypatch.context() as m:
-        m.setenv("FBASE_TRACE", "off")
+        m.setattr(fbtrace, "_trace_enabled", False)
         with caplog.at_level(level="DEBUG"):
             traced()(ctx.traced_noparam_noresult)()
         verify_func(caplog.records, "traced_noparam_noresult", True)
 
+def test_set_trace_enabled(caplog, monkeypatch):
+    monkeypatch.setattr(fbtrace, "_trace_enabled", fbtrace._trace_enabled)
+    trace_manager.flags = (TraceFlag.FAIL | TraceFlag.BEFORE | TraceFlag.AFTER)
+    add_trace(Traced, "traced_noparam_noresult")
+    fbtrace.set_trace_enabled(False)
+    assert not trace_manager.trace_active
+    ctx = Traced()
+    with caplog.at_level(level="DEBUG"):
+        ctx.traced_noparam_noresult()
+        traced()(ctx.traced_noparam_noresult)()
+    assert len(caplog.records) == 2
+    caplog.clear()
+    fbtrace.set_trace_enabled(True)
+    assert trace_manager.trace_active
+    ctx = Traced()
+    with caplog.at_level(level="DEBUG"):
+        ctx.traced_noparam_noresult()
+    assert len(caplog.records) == 3
+
 @pytest.mark.skipif(__debug__, reason="__debug__ is True")
 def test_debug(caplog, monkeypatch):
     with monkeypatch.context() as m:
         m.delenv("FBASE_TRACE")
-    ctx = Traced()
-    trace_manager.flags = (TraceFlag.ACTIVE | TraceFlag.FAIL | TraceFlag.BEFORE | TraceFlag.AFTER)
-    with caplog.at_level(level="DEBUG"):
-        traced()(ctx.traced_noparam_noresult)()
-    verify_func(caplog.records, "traced_noparam_noresult", True)
+        m.setattr(fbtrace, "_trace_enabled", convert_from_str(bool, os.getenv("FBASE_TRACE", str(__debug__))))
+        ctx = Traced()
+        trace_manager.flags = (TraceFlag.ACTIVE | TraceFlag.FAIL | TraceFlag.BEFORE | TraceFlag.AFTER)
+        with caplog.at_level(level="DEBUG"):
+            traced()(ctx.traced_noparam_noresult)()
+        verify_func(caplog.records, "traced_noparam_noresult", True)
 
 def test_decorated(caplog):
     "Default settings only, events: FAIL"
@@ -498,3 +568,223 @@ def test_add_traced(caplog):
         with pytest.raises(Error):
             traced()(ctx.traced_raises)()
     verify(caplog.records, "traced_raises", result="Error: No cookies left")
+
+def test_add_traced_instances(caplog):
+    "Instrumented class methods are shared by instances, but log the right agent"
+    trace_manager.flags |= (TraceFlag.FAIL | TraceFlag.BEFORE | TraceFlag.AFTER)
+    add_trace(Traced, "traced_param_result")
+    first = Traced("first")
+    second = Traced("second")
+    assert first.traced_param_result.__func__ is second.traced_param_result.__func__
+    assert first.traced_param_result.__self__ is first
+    with caplog.at_level(level="DEBUG"):
+        assert first.traced_param_result(1, 2) == "OK"
+        assert second.traced_param_result(3, 4, kw_only="NO-DEFAULT") == "OK"
+    assert len(caplog.records) == 6
+    assert [rec.agent for rec in caplog.records if rec.name == "trace"] == ["first", "first",
+                                                                            "second", "second"]
+    assert caplog.records[0].message == ">>> traced_param_result(pos_only=1, pos=2, kw='KW', kw_only='KW_ONLY')"
+    assert caplog.records[3].message == ">>> traced_param_result(pos_only=3, pos=4, kw='KW', kw_only='NO-DEFAULT')"
+
+def test_add_traced_binding(caplog):
+    "Instance of instrumented class method is not a parameter and is the agent"
+    class Odd(TracedMixin):
+        def __init__(self, logging_id: str):
+            self._agent_name_ = logging_id
+        def method(this, value) -> None: # noqa: N805
+            pass
+
+    agents = []
+    def callback(agent) -> bool:
+        agents.append(agent)
+        return True
+
+    trace_manager.flags |= TraceFlag.BEFORE
+    add_trace(Odd, "method", callback=callback)
+    ctx = Odd("odd")
+    with caplog.at_level(level="DEBUG"):
+        ctx.method(1)
+    assert caplog.records[0].message == ">>> method(value=1)"
+    assert caplog.records[0].agent == "odd"
+    assert agents == [ctx]
+    # Plain functions
+    agents.clear()
+    def foo(bar=""):
+        return f"Foo{bar}!"
+    with caplog.at_level(level="DEBUG"):
+        traced(callback=callback)(foo)()
+    assert agents == [None]
+
+def test_add_traced_var_args(caplog):
+    "Class methods without positional parameter for the instance get bound method"
+    class VarArgs(TracedMixin):
+        def method(*args, **kw): # noqa: ARG002
+            return len(args)
+
+    trace_manager.flags |= TraceFlag.BEFORE
+    add_trace(VarArgs, "method")
+    ctx = VarArgs()
+    with caplog.at_level(level="DEBUG"):
+        assert ctx.method(1, 2) == 3
+    assert caplog.records[0].message == ">>> method(args=(1, 2), kw={})"
+
+def test_add_traced_max_param_length(caplog):
+    "Instance of instrumented class method is not trimmed"
+    class Expensive(Traced):
+        formatted = 0
+        def __str__(self):
+            Expensive.formatted += 1
+            return "Expensive"
+
+    trace_manager.register(Expensive)
+    trace_manager.flags |= TraceFlag.BEFORE
+    add_trace(Expensive, "traced_param_result", max_param_length=5)
+    with caplog.at_level(level="DEBUG"):
+        Expensive().traced_param_result(1, "0123456789")
+    assert caplog.records[0].message == \
+        ">>> traced_param_result(pos_only=1, pos='01234..[5]', kw='KW', kw_only='KW_ON..[2]')"
+    assert Expensive.formatted == 0
+
+def test_add_traced_custom_decorator():
+    "Custom decorators get bound method"
+    decorated = []
+    def decorator():
+        def wrap(fn):
+            decorated.append(fn)
+            return fn
+        return wrap
+
+    trace_manager.decorator = decorator
+    add_trace(Traced, "traced_noparam_result")
+    ctx = Traced()
+    assert decorated[0].__self__ is ctx
+    assert ctx.traced_noparam_result() == "OK"
+
+def test_load_config(caplog):
+    "Classes are resolved by name, configuration is applied to registered descendants"
+    trace_manager.register(TracedDescendant)
+    cfg = ConfigParser()
+    cfg.read_string(f"""
+[trace]
+flags = ACTIVE | BEFORE | AFTER | FAIL
+classes = traced_class
+
+[traced_class]
+source = {__name__}.Traced
+methods = traced_noparam_result
+""")
+    trace_manager.load_config(cfg)
+    assert trace_manager.flags == TraceFlag.ACTIVE | TraceFlag.BEFORE | TraceFlag.AFTER | TraceFlag.FAIL
+    for cls in (Traced, TracedDescendant):
+        ctx = cls()
+        with caplog.at_level(level="DEBUG"):
+            ctx.traced_noparam_result()
+        assert len(caplog.records) == 3
+        assert caplog.records[0].message == ">>> traced_noparam_result()"
+        caplog.clear()
+
+def test_signature_cache():
+    def foo(bar=""):
+        return f"Foo{bar}!"
+
+    sig = fbtrace._get_signature(foo)
+    assert fbtrace._get_signature(foo) is sig
+    assert foo in fbtrace._signatures
+    ctx = Traced()
+    assert fbtrace._get_signature(ctx.traced_noparam_result) is not fbtrace._get_signature(ctx.traced_noparam_result)
+
+def test_exc_message(caplog):
+    class ExpensiveError(Error):
+        formatted = 0
+        def __str__(self):
+            ExpensiveError.formatted += 1
+            return "Expensive"
+
+    def fail():
+        raise ExpensiveError()
+
+    trace_manager.flags |= TraceFlag.FAIL
+    with caplog.at_level(level="INFO"):
+        with pytest.raises(ExpensiveError):
+            traced()(fail)()
+    assert ExpensiveError.formatted == 0
+    with caplog.at_level(level="DEBUG"):
+        with pytest.raises(ExpensiveError):
+            traced(msg_failed="{_exc_!r} {_exc_:>12}")(fail)()
+    assert caplog.records[0].message == ("'test_exc_message.<locals>.ExpensiveError: Expensive' "
+                                         "test_exc_message.<locals>.ExpensiveError: Expensive")
+    assert ExpensiveError.formatted == 1
+    caplog.clear()
+    with caplog.at_level(level="DEBUG"):
+        with pytest.raises(ExpensiveError):
+            traced(msg_failed="{_exc_[:14]} {_exc_.upper()[-9:]} {len(_exc_)}")(fail)()
+    assert caplog.records[0].message == "test_exc_messa EXPENSIVE 51"
+    # Parameter is plain str
+    seen = []
+    class custom_traced(traced): # noqa: N801
+        def log_failed(self, logger, params):
+            seen.append(params["_exc_"])
+            super().log_failed(logger, params)
+
+    with caplog.at_level(level="DEBUG"):
+        with pytest.raises(ExpensiveError):
+            custom_traced()(fail)()
+    assert seen == ["test_exc_message.<locals>.ExpensiveError: Expensive"]
+    assert type(seen[0]) is str
+
+def test_remove_trace(caplog):
+    trace_manager.flags |= (TraceFlag.BEFORE | TraceFlag.AFTER)
+    add_trace(Traced, "traced_noparam_result")
+    add_trace(Traced, "traced_noparam_noresult")
+    with caplog.at_level(level="DEBUG"):
+        Traced().traced_noparam_result()
+    assert len(caplog.records) == 3
+    caplog.clear()
+    remove_trace(Traced, "traced_noparam_result")
+    ctx = Traced()
+    with caplog.at_level(level="DEBUG"):
+        ctx.traced_noparam_result()
+    verify_func(caplog.records, "traced_noparam_result", True)
+    with caplog.at_level(level="DEBUG"):
+        ctx.traced_noparam_noresult()
+    assert len(caplog.records) == 3
+
+def test_load_config_all_methods():
+    cfg = ConfigParser()
+    cfg.read_string(f"""
+[trace]
+flags = ACTIVE | BEFORE
+classes = traced_class
+
+[traced_class]
+source = {__name__}.TracedDescendant
+methods = *
+""")
+    trace_manager.load_config(cfg)
+    entry = trace_manager._traced[TracedDescendant]
+    assert sorted(item.method for item in entry.traced) == ["traced_long_result", "traced_noparam_noresult",
+                                                           "traced_noparam_result", "traced_param_noresult",
+                                                           "traced_param_result", "traced_raises"]
+
+def test_load_config_reload():
+    "Instrumented class functions are reused when trace configuration is reloaded"
+    cfg = ConfigParser()
+    cfg.read_string(f"""
+[trace]
+flags = ACTIVE | BEFORE
+classes = traced_class
+
+[traced_class]
+source = {__name__}.Traced
+methods = traced_noparam_result, traced_param_result
+""")
+    trace_manager.load_config(cfg)
+    first = Traced()
+    trace_manager.load_config(cfg)
+    second = Traced()
+    assert first.traced_noparam_result.__func__ is second.traced_noparam_result.__func__
+    assert first.traced_param_result.__func__ is second.traced_param_result.__func__
+    add_trace(Traced, "traced_noparam_result", topic="other")
+    third = Traced()
+    assert third.traced_noparam_result.__func__ is not second.traced_noparam_result.__func__
+    assert third.traced_param_result.__func__ is second.traced_param_result.__func__
@@ -35,11 +35,13 @@
 
 from __future__ import annotations
 
+import gc
 import io
 from dataclasses import dataclass
 
 import pytest
 
+import firebird.base.types as fbtypes
 from firebird.base.types import *
 
 ns = {}
@@ -80,6 +82,9 @@ def test_exceptions():
     assert e.other_attr is None
     with pytest.raises(AttributeError):
         _ = e.__notes__
+    with pytest.raises(AttributeError):
+        _ = e.__deepcopy__
+    assert e._private_attr is None
 
 def test_conjunctive():
     "Test Conjunctive metaclass"
@@ -91,6 +96,9 @@ def test_conjunctive():
     ns.clear()
     _ = CC()
     assert ns == {"A": "A", "B": "B"}
+    # Single metaclass is used directly
+    class DD(AA, metaclass=conjunctive): pass
+    assert type(DD) is A
 
 def test_singletons():
     "Test Singletons"
@@ -105,6 +113,14 @@ def test_singletons():
     os = MyOtherSingleton()
     assert os is MyOtherSingleton()
     assert s is not os
+    assert MySingleton._singleton_ is s
+    assert MyOtherSingleton._singleton_ is os
+    # Singletons do not outlive their classes
+    key = MyOtherSingleton._singleton_key_
+    assert fbtypes._singletons_[key] is os
+    del os, MyOtherSingleton
+    gc.collect()
+    assert key not in fbtypes._singletons_
 
 def test_sentinel():
     "Test Sentinel"
@@ -128,6 +144,7 @@ def test_sentinel():
     assert "TEST-SENTINEL" not in Sentinel.instances
     Sentinel("TEST-SENTINEL")
     assert "TEST-SENTINEL" in Sentinel.instances
+    assert Sentinel("test-sentinel") is Sentinel("TEST-SENTINEL")
 
 def test_distinct():
     "Test Distinct"
@@ -191,6 +208,12 @@ def test_zmqaddress():
     assert addr.address == "127.0.0.1:*"
     assert addr.protocol == ZMQTransport.TCP
     assert addr.domain == ZMQDomain.NODE
+    assert not hasattr(addr, "__dict__")
+    #
+    addr = ZMQAddress("TCP://LocalHost:8001")
+    assert addr.address == "localhost:8001"
+    assert addr.protocol == ZMQTransport.TCP
+    assert addr.domain == ZMQDomain.NODE
     #
     addr = ZMQAddress("tcp://192.168.0.1:8001")
     assert addr.address == "192.168.0.1:8001"
@@ -224,6 +247,7 @@ def test_MIME():
     assert mime.type == "text"
     assert mime.subtype == "plain"
     assert mime.params == {"charset": "utf-8",}
+    assert mime.params is mime.params
     assert repr(mime) == "MIME('text/plain;charset=utf-8')"
     #
     mime = MIME("text/plain")
@@ -242,6 +266,30 @@ def test_MIME():
     with pytest.raises(ValueError) as cm:
         mime = MIME("text/plain;charset:utf-8")
     assert cm.value.args == ("Wrong specification of MIME type parameters",)
+    with pytest.raises(ValueError) as cm:
+        mime = MIME("text/plain;charset=utf-8;")
+    assert cm.value.args == ("Wrong specification of MIME type parameters",)
+    with pytest.raises(ValueError) as cm:
+        mime = MIME("text;subtype=a/b")
+    assert cm.value.args == ("MIME type specification must be 'type/subtype[;param=value;...]'",)
+    # Supported types are checked per class
+    class FontMIME(MIME):
+        MIME_TYPES = ['text', 'font'] # noqa: RUF012
+    assert MIME("image/png") == "image/png"
+    assert FontMIME("font/woff") == "font/woff"
+    with pytest.raises(ValueError) as cm:
+        FontMIME("image/png")
+    assert cm.value.args == ("MIME type 'image' not supported",)
+    with pytest.raises(ValueError) as cm:
+        MIME("font/woff")
+    assert cm.value.args == ("MIME type 'font' not supported",)
+    FontMIME.MIME_TYPES.append('model')
+    assert FontMIME("model/mesh") == "model/mesh"
+    FontMIME.MIME_TYPES.remove('text')
+    with pytest.raises(ValueError) as cm:
+        FontMIME("text/plain")
+    assert cm.value.args == ("MIME type 'text' not supported",)
+    assert isinstance(MIME.MIME_TYPES, list)
 
 def test_PyExpr():
     "Test PyExpr"
@@ -250,6 +298,7 @@ def test_PyExpr():
     expr = PyExpr(expr_str)
     assert expr == expr_str
     assert repr(expr) == f"PyExpr('{expr_str}')"
+    assert repr(PyExpr("this.name == 'x'")) == 'PyExpr("this.name == \'x\'")'
     obj = ValueHolder()
     obj.value = 1
     assert type(expr) == PyExpr
@@ -264,6 +313,13 @@ def test_PyExpr():
     assert not eval(expr, None, {"this": obj})
     assert not eval(expr.expr, None, {"this": obj})
     assert not fce(obj)
+    # Function code is compiled once, but each callable gets its own namespace
+    fce2 = expr.get_callable("this", {"some_name": "other"})
+    assert fce2 is not fce
+    assert fce2.__code__ is fce.__code__
+    assert fce.__globals__["some_name"] == "value"
+    assert fce2.__globals__["some_name"] == "other"
+    assert PyExpr(expr_str).expr is expr.expr
 
 def test_PyCode():
     "Test PyCode"
@@ -297,6 +353,8 @@ class Bar():
     assert code == func_str
     assert code.name == "foo"
     assert code(1) == 5
+    assert code.callable(1) == 5
+    assert code.callable.__name__ == "foo"
     #
     cls = PyCallable(class_str)
     assert cls == class_str
@@ -304,6 +362,12 @@ class Bar():
     obj = cls(1)
     assert obj.__class__.__name__ == "Bar"
     assert obj.value == 1
+    # Compiled code is shared, but each value defines its own callable
+    assert PyCallable(func_str)._callable_ is not code._callable_
+    assert PyCallable(func_str)._callable_.__code__ is code._callable_.__code__
+    #
+    assert PyCallable("class Baz:\n    pass\n").name == "Baz"
+    assert PyCallable(class_str + func_str).name == "foo"
 
 def test_load():
     "Test load function"
@@ -311,3 +375,6 @@ def test_load():
     assert obj is conjunctive
     fce = load("colorsys:rgb_to_hsv")
     assert fce(0.2, 0.4, 0.4) == (0.5, 0.5, 0.4)
+    assert load("firebird.base.types:ZMQAddress.protocol") is ZMQAddress.protocol
+    with pytest.raises(ValueError):
+        load("firebird.base.types.ZMQAddress")